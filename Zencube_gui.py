@@ -6,18 +6,143 @@ Description: Modern GUI for executing commands in ZenCube sandbox with resource
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox
+import codecs
+import io
 import subprocess
 import threading
 import os
+import platform
+import selectors
+import shlex
+import stat
 import sys
+from collections import deque
+from functools import lru_cache, partial
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
+_OS_NAME = platform.system()
+_IS_WINDOWS = _OS_NAME == "Windows"
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SANDBOX_CANDIDATES = (
+    "./sandbox",                                # Current directory
+    os.path.join(_HERE, "sandbox"),             # Same dir as script
+    "./zencube/sandbox",                        # Subdirectory
+    "../sandbox",                               # Parent directory
+    os.path.join(_HERE, "..", "sandbox"),       # Parent of script dir
+    "/usr/local/bin/sandbox",                   # System install
+    os.path.expanduser("~/zencube/sandbox")     # User home
+)
+
+_SEPARATOR = "=" * 80
+_TERMINAL_BANNER = "🧊 ZenCube Sandbox Terminal\n" + _SEPARATOR + "\n"
+_EXECUTING_HEADER = "\n" + _SEPARATOR + "\n🚀 Executing: {command}\n" + _SEPARATOR + "\n"
+_SANDBOX_FIX_HINT = (
+    "\n💡 To fix this:\n"
+    "   1. Make sure you're in the correct directory\n"
+    "   2. Build the sandbox: cd zencube && make\n"
+    "   3. Or run GUI from zencube directory: cd zencube && python Zencube_gui.py\n\n"
+)
+_SOURCE_EXTS = ('.c', '.cpp', '.cc', '.cxx')  # Source files users pick by mistake
+_SOURCE_FILE_TIP = "💡 Tip: Select the compiled executable (without .c extension)\n"
+
+_HELP_TEXT = """
+ZenCube Sandbox GUI - Help
+
+USAGE:
+1. Select a command/file using the Browse button or Quick Commands
+2. (Optional) Add command-line arguments
+3. Enable resource limits as needed:
+   - CPU Time: Limit execution time in seconds
+   - Memory: Limit memory usage in megabytes
+   - Max Processes: Prevent fork bombs
+   - File Size: Limit file writes in megabytes
+4. Toggle WSL option (Windows users should keep this enabled)
+5. Click "Execute Command" to run
+6. View output in the terminal area
+
+PRESETS:
+- No Limits: Run without any restrictions
+- Light: Generous limits for development
+- Medium: Balanced limits for testing
+- Strict: Tight limits for untrusted code
+
+WSL OPTION:
+- Enabled: Commands run through WSL (for Windows users)
+- Disabled: Commands run directly (for Linux/Unix users)
+- Auto-detected based on your operating system
+
+TIPS:
+- Use test programs in ./tests/ to verify limits
+- Check output terminal for detailed execution logs
+- Use Stop button to terminate long-running processes
+- Linux users should uncheck WSL for native execution
+
+For more information, see README.md
+        """
+
+_BACKSLASH_TO_SLASH = str.maketrans('\\', '/')
+
+@lru_cache(maxsize=256)
+def _windows_to_wsl_path(windows_path):
+    """Map a Windows path onto its /mnt/<drive> location inside WSL"""
+    if not ':' in windows_path:
+        return windows_path
+    
+    path = windows_path.translate(_BACKSLASH_TO_SLASH) if '\\' in windows_path else windows_path
+    
+    
+    if len(path) > 1 and path[1] == ':':
+        drive = path[0].lower()
+        rest = path[2:]  # Everything after "C:"
+        return f"/mnt/{drive}{rest}"
+    
+    return path
+
+@lru_cache(maxsize=128)
+def _split_args(args):
+    """Split an argument string with POSIX rules, since it runs under the Linux sandbox"""
+    return tuple(shlex.split(args))
+
 class ZenCubeGUI:
+    MAX_LINES = 5000   # Default cap on output terminal lines (adjustable in Settings)
+    MIN_LINES = 100    # Smallest cap accepted from the Settings dialog
+    WINDOW_WIDTH = 1200
+    WINDOW_HEIGHT = 800
+    POLL_MS = 30       # How often a running command's output is written to the terminal
+    
+    TAG_COLORS = {
+        "error": "#ff4444",
+        "success": "#44ff44",
+        "warning": "#ffaa00",
+        "info": "#4a9eff",
+    }
+    
+    # (button text, (cpu, memory, processes, file size), log description)
+    PRESETS = (
+        ("No Limits", (None, None, None, None), "No Limits"),
+        ("Light", ("30", "1024", None, None), "Light (CPU: 30s, Memory: 1GB)"),
+        ("Medium", ("10", "512", "10", None), "Medium (CPU: 10s, Memory: 512MB, Procs: 10)"),
+        ("Strict", ("5", "256", "5", "50"), "Strict (All limits enabled)"),
+    )
+    
+    QUICK_COMMANDS = (
+        ("/bin/ls", "-la"),
+        ("/bin/echo", "Hello ZenCube!"),
+        ("/usr/bin/whoami", ""),
+        ("./tests/infinite_loop", ""),
+        ("./tests/memory_hog", ""),
+    )
+    
+    _detected_sandbox_path = None  # Shared result of detect_sandbox_path
+    
     def __init__(self, root):
         self.root = root
         self.root.title("ZenCube Sandbox - GUI Controller")
-        self.root.geometry("1200x800")
+        self.root.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
         self.root.minsize(900, 600)
         
         
@@ -42,67 +167,92 @@ class ZenCubeGUI:
         self.fsize_enabled = tk.BooleanVar(value=False)
         self.fsize_limit = tk.StringVar(value="100")
         
+        # Sandbox flag and variables for each limit row, in row order
+        self._limit_specs = (
+            ("--cpu", self.cpu_enabled, self.cpu_limit),
+            ("--mem", self.mem_enabled, self.mem_limit),
+            ("--procs", self.procs_enabled, self.procs_limit),
+            ("--fsize", self.fsize_enabled, self.fsize_limit),
+        )
         
-        import platform
-        is_windows = platform.system() == "Windows"
-        self.use_wsl = tk.BooleanVar(value=is_windows)
+        self.wrap_output = tk.BooleanVar(value=False)
+        self.show_exec_command = tk.BooleanVar(value=True)
+        self.max_lines = self.MAX_LINES
+        self._follow_tail = True  # Kept current by the terminal's yscrollcommand
         
         
-        self.command_path = tk.StringVar(value="")
-        self.command_args = tk.StringVar(value="")
+        self.use_wsl = tk.BooleanVar(value=_IS_WINDOWS)
         
         
-        self.sandbox_path = self.detect_sandbox_path()
+        self._log_buffer = deque()  # Shared with the reader thread
+        
+        self.process = None
+        self._run_thread = None
+        self._log_flush_scheduled = False
+        
+        # Lets stop_execution wake the reader's select() immediately (POSIX only)
+        self._stop_r = self._stop_w = None
+        if not _IS_WINDOWS:
+            self._stop_r, self._stop_w = os.pipe()
+            os.set_blocking(self._stop_r, False)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        
+        # Resolved in _finish_init once the window is on screen
+        self.sandbox_path = "detecting..."
         
         
         self.create_widgets()
         
         
         self.center_window()
-    
-    def detect_sandbox_path(self):
-        """Detect the sandbox binary path"""
         
-        script_dir = os.path.dirname(os.path.abspath(__file__))
         
-        possible_paths = [
-            "./sandbox",                                      # Current directory
-            os.path.join(script_dir, "sandbox"),             # Same dir as script
-            "./zencube/sandbox",                             # Subdirectory
-            "../sandbox",                                     # Parent directory
-            os.path.join(script_dir, "..", "sandbox"),       # Parent of script dir
-            "/usr/local/bin/sandbox",                        # System install
-            os.path.expanduser("~/zencube/sandbox")          # User home
-        ]
+        self.root.after_idle(self._finish_init)
+    
+    def _finish_init(self):
+        """Build the remaining sections and locate the sandbox after the first paint"""
+        self.create_limits_section(self.main_frame)
+        self.create_control_buttons(self.main_frame)
         
-        for path in possible_paths:
-            full_path = os.path.abspath(path)
-            if os.path.exists(full_path) and os.path.isfile(full_path):
-                
-                import platform
-                if platform.system() != "Windows":
-                    if os.access(full_path, os.X_OK):
-                        return path
-                else:
-                    return path
+        self.sandbox_path = self.detect_sandbox_path()
+        self.create_status_bar()
+        self.validate_sandbox_exists()
+    
+    def detect_sandbox_path(self, refresh=False):
+        """Detect the sandbox binary path, reusing the previous result unless refresh is set"""
+        cls = type(self)
+        if refresh or cls._detected_sandbox_path is None:
+            cls._detected_sandbox_path = self._find_sandbox_path()
+        return cls._detected_sandbox_path
+    
+    def _find_sandbox_path(self):
+        """Search the known locations for the sandbox binary"""
+        for path in _SANDBOX_CANDIDATES:
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
+                continue
+            
+            if stat.S_ISREG(mode) and (_IS_WINDOWS or os.access(path, os.X_OK)):
+                return path
         
         
         return "./sandbox" 
     
     def center_window(self):
         """Center the window on screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        width = self.WINDOW_WIDTH
+        height = self.WINDOW_HEIGHT
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
     
     def create_widgets(self):
-        """Create all GUI widgets"""
+        """Create the widgets needed for the first paint; _finish_init adds the rest"""
         
         
-        main_frame = ttk.Frame(self.root, padding="10")
+        self.main_frame = main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         
@@ -118,16 +268,7 @@ class ZenCubeGUI:
         self.create_file_section(main_frame)
         
         
-        self.create_limits_section(main_frame)
-        
-        
         self.create_output_section(main_frame)
-        
-        
-        self.create_control_buttons(main_frame)
-        
-        
-        self.create_status_bar()
     
     def create_header(self, parent):
         """Create header with title and logo"""
@@ -159,8 +300,8 @@ class ZenCubeGUI:
         
         ttk.Label(file_frame, text="Command/File:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
         
-        command_entry = ttk.Entry(file_frame, textvariable=self.command_path, width=50)
-        command_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5)
+        self.command_entry = ttk.Entry(file_frame, width=50)
+        self.command_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5)
         
         browse_btn = ttk.Button(
             file_frame,
@@ -173,8 +314,8 @@ class ZenCubeGUI:
         
         ttk.Label(file_frame, text="Arguments:").grid(row=1, column=0, sticky=tk.W, padx=(0, 5), pady=(10, 0))
         
-        args_entry = ttk.Entry(file_frame, textvariable=self.command_args, width=50)
-        args_entry.grid(row=1, column=1, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=(10, 0))
+        self.args_entry = ttk.Entry(file_frame, width=50)
+        self.args_entry.grid(row=1, column=1, columnspan=2, sticky=(tk.W, tk.E), padx=5, pady=(10, 0))
         
         
         ttk.Label(file_frame, text="Quick Commands:").grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
@@ -182,19 +323,11 @@ class ZenCubeGUI:
         quick_frame = ttk.Frame(file_frame)
         quick_frame.grid(row=2, column=1, columnspan=2, sticky=tk.W, pady=(10, 0))
         
-        quick_commands = [
-            ("/bin/ls", "-la"),
-            ("/bin/echo", "Hello ZenCube!"),
-            ("/usr/bin/whoami", ""),
-            ("./tests/infinite_loop", ""),
-            ("./tests/memory_hog", ""),
-        ]
-        
-        for i, (cmd, args) in enumerate(quick_commands):
+        for i, (cmd, args) in enumerate(self.QUICK_COMMANDS):
             btn = ttk.Button(
                 quick_frame,
                 text=cmd.split('/')[-1],
-                command=lambda c=cmd, a=args: self.set_quick_command(c, a),
+                command=partial(self.set_quick_command, cmd, args),
                 width=12
             )
             btn.grid(row=0, column=i, padx=2)
@@ -209,60 +342,33 @@ class ZenCubeGUI:
         limits_frame.columnconfigure(3, weight=1)
         
         
-        cpu_check = ttk.Checkbutton(
-            limits_frame,
-            text="CPU Time (seconds)",
-            variable=self.cpu_enabled,
-            command=self.update_limit_states
-        )
-        cpu_check.grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.cpu_entry = ttk.Entry(limits_frame, textvariable=self.cpu_limit, width=10, state='disabled')
-        self.cpu_entry.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(limits_frame, text="(Default: 5s)").grid(row=0, column=2, sticky=tk.W, padx=5)
-        
-        
-        mem_check = ttk.Checkbutton(
-            limits_frame,
-            text="Memory (MB)",
-            variable=self.mem_enabled,
-            command=self.update_limit_states
-        )
-        mem_check.grid(row=1, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.mem_entry = ttk.Entry(limits_frame, textvariable=self.mem_limit, width=10, state='disabled')
-        self.mem_entry.grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(limits_frame, text="(Default: 256 MB)").grid(row=1, column=2, sticky=tk.W, padx=5)
-        
-        
-        procs_check = ttk.Checkbutton(
-            limits_frame,
-            text="Max Processes",
-            variable=self.procs_enabled,
-            command=self.update_limit_states
+        limit_rows = (
+            ("CPU Time (seconds)", self.cpu_enabled, self.cpu_limit, "(Default: 5s)"),
+            ("Memory (MB)", self.mem_enabled, self.mem_limit, "(Default: 256 MB)"),
+            ("Max Processes", self.procs_enabled, self.procs_limit, "(Default: 10)"),
+            ("File Size (MB)", self.fsize_enabled, self.fsize_limit, "(Default: 100 MB)"),
         )
-        procs_check.grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
-        
-        self.procs_entry = ttk.Entry(limits_frame, textvariable=self.procs_limit, width=10, state='disabled')
-        self.procs_entry.grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
         
-        ttk.Label(limits_frame, text="(Default: 10)").grid(row=2, column=2, sticky=tk.W, padx=5)
+        entries = []
+        for row, (text, enabled, limit, default_text) in enumerate(limit_rows):
+            ttk.Checkbutton(
+                limits_frame,
+                text=text,
+                variable=enabled,
+                command=self.update_limit_states
+            ).grid(row=row, column=0, sticky=tk.W, padx=5, pady=5)
+            
+            entry = ttk.Entry(limits_frame, textvariable=limit, width=10, state='disabled')
+            entry.grid(row=row, column=1, sticky=tk.W, padx=5, pady=5)
+            entries.append(entry)
+            
+            ttk.Label(limits_frame, text=default_text).grid(row=row, column=2, sticky=tk.W, padx=5)
         
+        self.cpu_entry, self.mem_entry, self.procs_entry, self.fsize_entry = entries
         
-        fsize_check = ttk.Checkbutton(
-            limits_frame,
-            text="File Size (MB)",
-            variable=self.fsize_enabled,
-            command=self.update_limit_states
-        )
-        fsize_check.grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
         
-        self.fsize_entry = ttk.Entry(limits_frame, textvariable=self.fsize_limit, width=10, state='disabled')
-        self.fsize_entry.grid(row=3, column=1, sticky=tk.W, padx=5, pady=5)
-        
-        ttk.Label(limits_frame, text="(Default: 100 MB)").grid(row=3, column=2, sticky=tk.W, padx=5)
+        self._limit_widgets = tuple(zip((enabled for _, enabled, _, _ in limit_rows), entries))
+        self._limit_states = (False,) * len(self._limit_widgets)  # Entries start disabled
         
         
         preset_frame = ttk.Frame(limits_frame)
@@ -270,10 +376,13 @@ class ZenCubeGUI:
         
         ttk.Label(preset_frame, text="Presets:").grid(row=0, column=0, padx=(0, 10))
         
-        ttk.Button(preset_frame, text="No Limits", command=self.preset_none, width=12).grid(row=0, column=1, padx=2)
-        ttk.Button(preset_frame, text="Light", command=self.preset_light, width=12).grid(row=0, column=2, padx=2)
-        ttk.Button(preset_frame, text="Medium", command=self.preset_medium, width=12).grid(row=0, column=3, padx=2)
-        ttk.Button(preset_frame, text="Strict", command=self.preset_strict, width=12).grid(row=0, column=4, padx=2)
+        for i, (text, values, description) in enumerate(self.PRESETS, start=1):
+            ttk.Button(
+                preset_frame,
+                text=text,
+                command=partial(self._apply_preset, values, description),
+                width=12
+            ).grid(row=0, column=i, padx=2)
         
         
         wsl_frame = ttk.Frame(limits_frame)
@@ -287,8 +396,7 @@ class ZenCubeGUI:
         )
         wsl_check.grid(row=0, column=0, sticky=tk.W)
         
-        import platform
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             ttk.Label(wsl_frame, text="(Auto-detected: Windows)", foreground="green").grid(row=0, column=1, padx=(10, 0))
         else:
             ttk.Label(wsl_frame, text="(Auto-detected: Linux/Unix)", foreground="blue").grid(row=0, column=1, padx=(10, 0))
@@ -301,46 +409,74 @@ class ZenCubeGUI:
         output_frame.rowconfigure(0, weight=1)
         
         
-        self.output_text = scrolledtext.ScrolledText(
+        # Plain Text without wrapping: long lines skip the wrap layout pass
+        self.output_text = tk.Text(
             output_frame,
-            wrap=tk.WORD,
+            wrap=tk.NONE,
             width=80,
             height=20,
             font=("Courier", 10),
             bg="#1e1e1e",
             fg="#00ff00",
-            insertbackground="#00ff00"
+            insertbackground="#00ff00",
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            blockcursor=False
         )
         self.output_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        y_scroll = ttk.Scrollbar(output_frame, orient=tk.VERTICAL, command=self.output_text.yview)
+        y_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        x_scroll = ttk.Scrollbar(output_frame, orient=tk.HORIZONTAL, command=self.output_text.xview)
+        x_scroll.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
-        self.output_text.tag_configure("error", foreground="#ff4444")
-        self.output_text.tag_configure("success", foreground="#44ff44")
-        self.output_text.tag_configure("warning", foreground="#ffaa00")
-        self.output_text.tag_configure("info", foreground="#4a9eff")
+        def on_yscroll(first, last):
+            # Tk reports every view change here (wheel, drag, keys), so track the tail once
+            y_scroll.set(first, last)
+            self._follow_tail = float(last) >= 0.999
         
+        self.output_text.configure(yscrollcommand=on_yscroll, xscrollcommand=x_scroll.set)
         
-        self.log_output("🧊 ZenCube Sandbox Terminal\n", "info")
-        self.log_output("=" * 80 + "\n", "info")
-        self.log_output("Ready to execute commands. Select a file and configure limits.\n\n", "success")
+        options_frame = ttk.Frame(output_frame)
+        options_frame.grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
         
+        ttk.Checkbutton(
+            options_frame,
+            text="Wrap lines",
+            variable=self.wrap_output,
+            command=self.toggle_wrap
+        ).grid(row=0, column=0, sticky=tk.W)
         
-        self.validate_sandbox_exists()
+        ttk.Checkbutton(
+            options_frame,
+            text="Show executed command",
+            variable=self.show_exec_command
+        ).grid(row=0, column=1, sticky=tk.W, padx=(10, 0))
+        
+        
+        for tag, color in self.TAG_COLORS.items():
+            self.output_text.tag_configure(tag, foreground=color)
+        
+        
+        self.log_output(_TERMINAL_BANNER, "info")
+        self.log_output("Ready to execute commands. Select a file and configure limits.\n\n", "success")
+    
+    def toggle_wrap(self):
+        """Switch the output terminal between wrapped and unwrapped lines"""
+        self.output_text.configure(wrap=tk.WORD if self.wrap_output.get() else tk.NONE)
     
     def validate_sandbox_exists(self):
         """Check if sandbox binary exists and warn if not"""
         if not os.path.exists(self.sandbox_path):
-            self.log_output("⚠️ WARNING: Sandbox binary not found!\n", "warning")
-            self.log_output(f"   Looking for: {self.sandbox_path}\n", "warning")
-            self.log_output(f"   Current directory: {os.getcwd()}\n", "info")
-            self.log_output("\n💡 To fix this:\n", "info")
-            self.log_output("   1. Make sure you're in the correct directory\n", "info")
-            self.log_output("   2. Build the sandbox: cd zencube && make\n", "info")
-            self.log_output("   3. Or run GUI from zencube directory: cd zencube && python Zencube_gui.py\n\n", "info")
+            self.log_output(
+                f"⚠️ WARNING: Sandbox binary not found!\n   Looking for: {self.sandbox_path}\n",
+                "warning"
+            )
+            self.log_output(f"   Current directory: {os.getcwd()}\n" + _SANDBOX_FIX_HINT, "info")
         else:
         
-            import platform
-            if platform.system() != "Windows":
+            if not _IS_WINDOWS:
                 if not os.access(self.sandbox_path, os.X_OK):
                     self.log_output("⚠️ WARNING: Sandbox found but not executable!\n", "warning")
                     self.log_output(f"   Run: chmod +x {self.sandbox_path}\n\n", "info")
@@ -399,18 +535,27 @@ class ZenCubeGUI:
     
     def create_status_bar(self):
         """Create status bar at bottom"""
-        import platform
-        os_name = platform.system()
-        wsl_status = "WSL Mode" if self.use_wsl.get() else "Native Mode"
-        
+        self._status_text = self._update_ready_status()
         self.status_bar = ttk.Label(
             self.root,
-            text=f"Ready | OS: {os_name} | {wsl_status} | Sandbox: {self.sandbox_path}",
+            text=self._status_text,
             relief=tk.SUNKEN,
             anchor=tk.W
         )
         self.status_bar.grid(row=1, column=0, sticky=(tk.W, tk.E))
     
+    def _set_status(self, text):
+        """Show text in the status bar, skipping the Tk call when nothing changed"""
+        if text != self._status_text:
+            self._status_text = text
+            self.status_bar.config(text=text)
+    
+    def _update_ready_status(self):
+        """Rebuild the cached idle status text after the WSL mode or sandbox path changes"""
+        wsl_status = "WSL Mode" if self.use_wsl.get() else "Native Mode"
+        self._ready_status = f"Ready | OS: {_OS_NAME} | {wsl_status} | Sandbox: {self.sandbox_path}"
+        return self._ready_status
+    
     def browse_file(self):
         """Open file browser dialog"""
         filename = filedialog.askopenfilename(
@@ -425,15 +570,14 @@ class ZenCubeGUI:
         
         if filename:
         
-            if filename.endswith('.c') or filename.endswith('.cpp'):
+            if filename.endswith(_SOURCE_EXTS):
                 self.log_output(f"⚠️ Warning: You selected a source file ({filename})\n", "warning")
-                self.log_output(f"💡 Tip: Select the compiled executable (without .c extension)\n", "info")
                 
         
                 executable = filename.rsplit('.', 1)[0]
-                self.log_output(f"💡 Try selecting: {executable}\n", "info")
+                self.log_output(_SOURCE_FILE_TIP + f"💡 Try selecting: {executable}\n", "info")
             
-            self.command_path.set(filename)
+            self._set_entry_text(self.command_entry, filename)
             self.log_output(f"📁 Selected file: {filename}\n", "info")
             
         
@@ -443,16 +587,25 @@ class ZenCubeGUI:
     
     def set_quick_command(self, command, args):
         """Set a quick command"""
-        self.command_path.set(command)
-        self.command_args.set(args)
+        self._set_entry_text(self.command_entry, command)
+        self._set_entry_text(self.args_entry, args)
         self.log_output(f"⚡ Quick command set: {command} {args}\n", "info")
     
+    @staticmethod
+    def _set_entry_text(entry, text):
+        """Replace the contents of an entry widget"""
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
+    
     def update_limit_states(self):
         """Enable/disable entry fields based on checkboxes"""
-        self.cpu_entry.config(state='normal' if self.cpu_enabled.get() else 'disabled')
-        self.mem_entry.config(state='normal' if self.mem_enabled.get() else 'disabled')
-        self.procs_entry.config(state='normal' if self.procs_enabled.get() else 'disabled')
-        self.fsize_entry.config(state='normal' if self.fsize_enabled.get() else 'disabled')
+        states = tuple(enabled.get() for enabled, _ in self._limit_widgets)
+        if states == self._limit_states:
+            return
+        self._limit_states = states
+        
+        for (_, entry), enabled in zip(self._limit_widgets, states):
+            entry.config(state='normal' if enabled else 'disabled')
     
     def update_wsl_status(self):
         """Update status when WSL checkbox changes"""
@@ -460,63 +613,59 @@ class ZenCubeGUI:
             self.log_output("🔄 WSL mode enabled - Commands will run via WSL\n", "info")
         else:
             self.log_output("🐧 Native mode enabled - Commands will run directly\n", "info")
+        
+        ready_status = self._update_ready_status()
+        if self.process is None:
+            self._set_status(ready_status)
     
-    def preset_none(self):
-        """Disable all limits"""
-        self.cpu_enabled.set(False)
-        self.mem_enabled.set(False)
-        self.procs_enabled.set(False)
-        self.fsize_enabled.set(False)
-        self.update_limit_states()
-        self.log_output("📋 Preset applied: No Limits\n", "info")
-    
-    def preset_light(self):
-        """Apply light limits"""
-        self.cpu_enabled.set(True)
-        self.cpu_limit.set("30")
-        self.mem_enabled.set(True)
-        self.mem_limit.set("1024")
-        self.procs_enabled.set(False)
-        self.fsize_enabled.set(False)
-        self.update_limit_states()
-        self.log_output("📋 Preset applied: Light (CPU: 30s, Memory: 1GB)\n", "info")
-    
-    def preset_medium(self):
-        """Apply medium limits"""
-        self.cpu_enabled.set(True)
-        self.cpu_limit.set("10")
-        self.mem_enabled.set(True)
-        self.mem_limit.set("512")
-        self.procs_enabled.set(True)
-        self.procs_limit.set("10")
-        self.fsize_enabled.set(False)
+    def _apply_preset(self, values, description):
+        """Apply a preset; values holds one limit per row, None leaves that limit off"""
+        for (_, enabled, limit), value in zip(self._limit_specs, values):
+            enabled.set(value is not None)
+            if value is not None:
+                limit.set(value)
         self.update_limit_states()
-        self.log_output("📋 Preset applied: Medium (CPU: 10s, Memory: 512MB, Procs: 10)\n", "info")
-    
-    def preset_strict(self):
-        """Apply strict limits"""
-        self.cpu_enabled.set(True)
-        self.cpu_limit.set("5")
-        self.mem_enabled.set(True)
-        self.mem_limit.set("256")
-        self.procs_enabled.set(True)
-        self.procs_limit.set("5")
-        self.fsize_enabled.set(True)
-        self.fsize_limit.set("50")
-        self.update_limit_states()
-        self.log_output("📋 Preset applied: Strict (All limits enabled)\n", "info")
+        self.log_output(f"📋 Preset applied: {description}\n", "info")
     
     def log_output(self, message, tag=None):
-        """Add message to output terminal"""
-        self.output_text.insert(tk.END, message, tag)
-        self.output_text.see(tk.END)
-        self.output_text.update()
+        """Queue message for the output terminal"""
+        self._log_buffer.append((message, tag))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(30, self._flush_log)
+    
+    def _queue_output(self, message, tag=None):
+        """Queue message from the reader thread; _poll_run writes it out"""
+        self._log_buffer.append((message, tag))
+    
+    def _flush_log(self):
+        """Write queued messages with one insert per run of equal tags"""
+        self._log_flush_scheduled = False
+        buffer = self._log_buffer
+        popleft = buffer.popleft
+        pending = [popleft() for _ in range(len(buffer))]
+        if not pending:
+            return
+        
+        output_text = self.output_text
+        insert = output_text.insert
+        for tag, group in groupby(pending, key=itemgetter(1)):
+            insert(tk.END, "".join(message for message, _ in group), tag)
+        
+        lines = int(output_text.index('end-1c').split('.')[0])
+        if lines > self.max_lines:
+            # Keep the newest 80% so the next trim isn't due on the very next flush
+            output_text.delete('1.0', f'{lines - self.max_lines * 4 // 5}.0')
+        
+        # Only follow the tail if the user hasn't scrolled up to read
+        if self._follow_tail:
+            output_text.see(tk.END)
     
     def clear_output(self):
         """Clear output terminal"""
+        self._log_buffer.clear()
         self.output_text.delete(1.0, tk.END)
-        self.log_output("🧊 ZenCube Sandbox Terminal\n", "info")
-        self.log_output("=" * 80 + "\n", "info")
+        self.log_output(_TERMINAL_BANNER, "info")
         self.log_output("Output cleared.\n\n", "success")
     
     def convert_to_wsl_path(self, windows_path):
@@ -525,25 +674,12 @@ class ZenCubeGUI:
         if not self.use_wsl.get():
             return windows_path
         
-        
-        if not ':' in windows_path:
-            return windows_path
-        
-        path = windows_path.replace('\\', '/')
-        
-        
-        if len(path) > 1 and path[1] == ':':
-            drive = path[0].lower()
-            rest = path[2:]  # Everything after "C:"
-            wsl_path = f"/mnt/{drive}{rest}"
-            return wsl_path
-        
-        return path
+        return _windows_to_wsl_path(windows_path)
     
     def build_command(self):
         """Build the sandbox command with all options"""
-        command = self.command_path.get().strip()
-        args = self.command_args.get().strip()
+        command = self.command_entry.get().strip()
+        args = self.args_entry.get().strip()
         
         if not command:
             raise ValueError("No command specified")
@@ -558,30 +694,19 @@ class ZenCubeGUI:
             cmd_parts = [self.sandbox_path]
         
         
-        if self.cpu_enabled.get():
-            cpu_val = self.cpu_limit.get().strip()
-            if cpu_val:
-                cmd_parts.append(f"--cpu={cpu_val}")
-        
-        if self.mem_enabled.get():
-            mem_val = self.mem_limit.get().strip()
-            if mem_val:
-                cmd_parts.append(f"--mem={mem_val}")
-        
-        if self.procs_enabled.get():
-            procs_val = self.procs_limit.get().strip()
-            if procs_val:
-                cmd_parts.append(f"--procs={procs_val}")
-        
-        if self.fsize_enabled.get():
-            fsize_val = self.fsize_limit.get().strip()
-            if fsize_val:
-                cmd_parts.append(f"--fsize={fsize_val}")
+        for flag, enabled, limit in self._limit_specs:
+            if enabled.get():
+                value = limit.get().strip()
+                if value:
+                    cmd_parts.append(f"{flag}={value}")
         
         
         cmd_parts.append(wsl_command)
         if args:
-            cmd_parts.extend(args.split())
+            try:
+                cmd_parts.extend(_split_args(args))
+            except ValueError as e:
+                raise ValueError(f"Invalid arguments: {e}") from e
         
         return cmd_parts
     
@@ -589,38 +714,41 @@ class ZenCubeGUI:
         """Execute the sandbox command in a separate thread"""
         try:
             
-            command = self.command_path.get().strip()
+            command = self.command_entry.get().strip()
             if not command:
                 raise ValueError("No command specified. Please enter a command or use Browse.")
             
             
-            if command.endswith('.c') or command.endswith('.cpp'):
+            if command.endswith(_SOURCE_EXTS):
+                executable = command.rsplit('.', 1)[0]
                 error_msg = (
                     "⚠️ Cannot execute source file!\n\n"
                     f"You selected: {command}\n\n"
                     "Please select the compiled executable (without .c extension).\n"
-                    f"Try: {command.rsplit('.', 1)[0]}"
+                    f"Try: {executable}"
                 )
                 messagebox.showerror("Invalid File Type", error_msg)
                 self.log_output(f"❌ Error: Cannot execute source file: {command}\n", "error")
-                self.log_output(f"💡 Select the executable: {command.rsplit('.', 1)[0]}\n", "info")
+                self.log_output(f"💡 Select the executable: {executable}\n", "info")
                 return
             
             cmd_parts = self.build_command()
             
             
-            self.log_output("\n" + "=" * 80 + "\n", "info")
-            self.log_output(f"🚀 Executing: {' '.join(cmd_parts)}\n", "info")
-            self.log_output("=" * 80 + "\n", "info")
+            if self.show_exec_command.get():
+                self.log_output(_EXECUTING_HEADER.format(command=shlex.join(cmd_parts)), "info")
             
             
             self.execute_btn.config(state='disabled')
             self.stop_btn.config(state='normal')
-            self.status_bar.config(text="Running...")
+            self._set_status("Running...")
             
+            # Before the process starts, or an early Stop for this run would be eaten
+            self._drain_stop_pipe()
             
-            thread = threading.Thread(target=self.run_command, args=(cmd_parts,), daemon=True)
-            thread.start()
+            self._run_thread = threading.Thread(target=self.run_command, args=(cmd_parts,), daemon=True)
+            self._run_thread.start()
+            self.root.after(self.POLL_MS, self._poll_run)
             
         except ValueError as e:
             messagebox.showerror("Error", str(e))
@@ -636,14 +764,24 @@ class ZenCubeGUI:
                 cmd_parts,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=0
             )
             
             
-            for line in self.process.stdout:
-                self.root.after(0, self.log_output, line)
+            # Read whatever the pipe holds instead of waiting for each newline
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")("replace"), translate=True
+            )
+            decode = decoder.decode
+            queue_output = self._queue_output
+            for chunk in self._read_chunks(self.process.stdout.fileno()):
+                text = decode(chunk)
+                if text:
+                    queue_output(text)
+            
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                self._queue_output(tail)
             
             
             self.process.wait()
@@ -651,79 +789,100 @@ class ZenCubeGUI:
             
             
             if exit_code == 0:
-                self.root.after(0, self.log_output, f"\n✅ Command completed successfully (exit code: {exit_code})\n", "success")
+                self._queue_output(f"\n✅ Command completed successfully (exit code: {exit_code})\n", "success")
             else:
-                self.root.after(0, self.log_output, f"\n⚠️ Command exited with code: {exit_code}\n", "warning")
+                self._queue_output(f"\n⚠️ Command exited with code: {exit_code}\n", "warning")
             
         except Exception as e:
-            self.root.after(0, self.log_output, f"\n❌ Execution error: {e}\n", "error")
+            self._queue_output(f"\n❌ Execution error: {e}\n", "error")
         
         finally:
-            
-            self.root.after(0, self.execute_btn.config, {'state': 'normal'})
-            self.root.after(0, self.stop_btn.config, {'state': 'disabled'})
-            self.root.after(0, self.status_bar.config, {'text': 'Ready'})
             self.process = None
     
+    def _drain_stop_pipe(self):
+        """Drop a stop request left over from a run that had already finished"""
+        if self._stop_r is None:
+            return
+        try:
+            while os.read(self._stop_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+    
+    def _read_chunks(self, fd):
+        """Yield output chunks until EOF, or until stop_execution writes to the stop pipe"""
+        if self._stop_r is None:
+            # select() only accepts sockets on Windows; terminate() ends the stream there
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    return
+                yield chunk
+        
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            selector.register(self._stop_r, selectors.EVENT_READ)
+            while True:
+                for key, _ in selector.select():
+                    if key.fd == self._stop_r:
+                        return
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        return
+                    yield chunk
+    
+    def _poll_run(self):
+        """Write reader output from the GUI thread and reset the controls once the run ends"""
+        # Check before flushing so output queued just before the thread exits is not missed
+        running = self._run_thread.is_alive()
+        self._flush_log()
+        if running:
+            self.root.after(self.POLL_MS, self._poll_run)
+            return
+        
+        self.execute_btn.config(state='normal')
+        self.stop_btn.config(state='disabled')
+        self._set_status(self._ready_status)
+    
     def stop_execution(self):
         """Stop the currently running command"""
-        if hasattr(self, 'process') and self.process:
-            self.process.terminate()
+        process = self.process  # The reader thread clears this when the run ends
+        if process is not None:
+            process.terminate()
+            if self._stop_w is not None:
+                # Wake the reader even if a child process still holds the pipe open
+                os.write(self._stop_w, b"\0")
             self.log_output("\n🛑 Execution stopped by user\n", "warning")
-            self.status_bar.config(text="Stopped")
+            self._set_status("Stopped")
+    
+    def on_close(self):
+        """Stop any running command and release the stop pipe before the window goes away"""
+        self.stop_execution()
+        if self._run_thread is not None:
+            self._run_thread.join(timeout=1)
+        for fd in (self._stop_r, self._stop_w):
+            if fd is not None:
+                os.close(fd)
+        self._stop_r = self._stop_w = None
+        self.root.destroy()
     
     def show_help(self):
         """Show help dialog"""
-        help_text = """
-ZenCube Sandbox GUI - Help
-
-USAGE:
-1. Select a command/file using the Browse button or Quick Commands
-2. (Optional) Add command-line arguments
-3. Enable resource limits as needed:
-   - CPU Time: Limit execution time in seconds
-   - Memory: Limit memory usage in megabytes
-   - Max Processes: Prevent fork bombs
-   - File Size: Limit file writes in megabytes
-4. Toggle WSL option (Windows users should keep this enabled)
-5. Click "Execute Command" to run
-6. View output in the terminal area
-
-PRESETS:
-- No Limits: Run without any restrictions
-- Light: Generous limits for development
-- Medium: Balanced limits for testing
-- Strict: Tight limits for untrusted code
-
-WSL OPTION:
-- Enabled: Commands run through WSL (for Windows users)
-- Disabled: Commands run directly (for Linux/Unix users)
-- Auto-detected based on your operating system
-
-TIPS:
-- Use test programs in ./tests/ to verify limits
-- Check output terminal for detailed execution logs
-- Use Stop button to terminate long-running processes
-- Linux users should uncheck WSL for native execution
-
-For more information, see README.md
-        """
-        
-        messagebox.showinfo("ZenCube Help", help_text)
+        messagebox.showinfo("ZenCube Help", _HELP_TEXT)
     
     def show_settings(self):
         """Show settings dialog"""
         settings_window = tk.Toplevel(self.root)
         settings_window.title("ZenCube Settings")
-        settings_window.geometry("600x300")
+        settings_window.geometry("600x350")
         settings_window.transient(self.root)
         settings_window.grab_set()
         
         
         settings_window.update_idletasks()
         x = (settings_window.winfo_screenwidth() // 2) - (300)
-        y = (settings_window.winfo_screenheight() // 2) - (150)
-        settings_window.geometry(f'600x300+{x}+{y}')
+        y = (settings_window.winfo_screenheight() // 2) - (175)
+        settings_window.geometry(f'600x350+{x}+{y}')
         
         
         main_frame = ttk.Frame(settings_window, padding="20")
@@ -774,25 +933,50 @@ For more information, see README.md
         status_text.config(state='disabled')
         
         
+        ttk.Label(main_frame, text="Max Output Lines:").grid(row=3, column=0, sticky=tk.W, pady=10)
+        
+        max_lines_var = tk.StringVar(value=str(self.max_lines))
+        ttk.Entry(main_frame, textvariable=max_lines_var, width=10).grid(row=3, column=1, sticky=tk.W, padx=10, pady=10)
+        
+        
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=3, column=0, columnspan=3, pady=(20, 0))
+        button_frame.grid(row=4, column=0, columnspan=3, pady=(20, 0))
         
         def apply_settings():
+            try:
+                max_lines = int(max_lines_var.get().strip())
+            except ValueError:
+                max_lines = 0
+            if max_lines < self.MIN_LINES:
+                messagebox.showerror(
+                    "Invalid Setting",
+                    f"Max output lines must be a whole number of at least {self.MIN_LINES}.",
+                    parent=settings_window
+                )
+                return
+            
             new_path = sandbox_var.get().strip()
-            if new_path:
-                self.sandbox_path = new_path
-                self.log_output(f"\n⚙️ Sandbox path updated to: {new_path}\n", "info")
-                self.validate_sandbox_exists()
-                
-                import platform
-                os_name = platform.system()
-                wsl_status = "WSL Mode" if self.use_wsl.get() else "Native Mode"
-                self.status_bar.config(text=f"Ready | OS: {os_name} | {wsl_status} | Sandbox: {self.sandbox_path}")
-                settings_window.destroy()
+            if not new_path:
+                messagebox.showerror(
+                    "Invalid Setting",
+                    "Sandbox path must not be empty.",
+                    parent=settings_window
+                )
+                return
+            
+            # Everything is valid; apply the settings together
+            self.max_lines = max_lines
+            self.sandbox_path = new_path
+            self.log_output(f"\n⚙️ Sandbox path updated to: {new_path}\n", "info")
+            self.validate_sandbox_exists()
+            
+            self._set_status(self._update_ready_status())
+            settings_window.destroy()
         
         def reset_to_default():
-            self.sandbox_path = self.detect_sandbox_path()
+            self.sandbox_path = self.detect_sandbox_path(refresh=True)
             sandbox_var.set(self.sandbox_path)
+            self._set_status(self._update_ready_status())
             self.log_output(f"\n🔄 Sandbox path reset to: {self.sandbox_path}\n", "info")
         
         ttk.Button(button_frame, text="Apply", command=apply_settings, width=15).grid(row=0, column=0, padx=5)
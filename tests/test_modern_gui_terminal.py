@@ -0,0 +1,90 @@
+"""
+Terminal behaviour of the modern GUI, run against a real subprocess under an
+offscreen Qt platform. The optional gui.* panels are stubbed when missing.
+"""
+
+import os
+import shlex
+import sys
+import time
+import types
+
+import pytest
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="uses a shell-script sandbox stand-in")
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("PySide6")
+
+# The File Jail, network and monitor panels live outside this tree; the terminal doesn't need them
+for _module, _attach in (
+    ("file_jail_panel", "attach_file_jail_panel"),
+    ("monitor_panel", "attach_monitor_panel"),
+    ("network_panel", "attach_network_panel"),
+):
+    try:
+        __import__(f"gui.{_module}")
+    except ImportError:
+        sys.modules.setdefault("gui", types.ModuleType("gui"))
+        stub = types.ModuleType(f"gui.{_module}")
+        setattr(stub, _attach, lambda window, layout: None)
+        sys.modules[f"gui.{_module}"] = stub
+
+import zencube_modern_gui as gui
+from PySide6.QtWidgets import QApplication
+
+
+def _wait_until(app, predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for the GUI"
+        app.processEvents()
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def window(app, tmp_path):
+    # Stand-in for the sandbox binary: run the target command without any limits
+    launcher = tmp_path / "sandbox"
+    launcher.write_text('#!/bin/sh\nexec "$@"\n')
+    launcher.chmod(0o755)
+
+    win = gui.ZenCubeModernGUI()
+    win._sandbox_validator.wait()
+    win.sandbox_path = str(launcher)
+    win.use_wsl = False
+    win._update_mode_state()
+    yield win
+    if win.executor is not None:
+        win.executor.wait()
+    win.close()
+    app.processEvents()
+
+
+def test_run_while_hidden_is_replayed_with_its_header(app, window):
+    script = "print('hello from the sandbox')"
+    window.toggle_terminal()  # Hide
+    window.command_input.setText(sys.executable)
+    window.args_input.setText(f'-c "{script}"')
+    window.execute_command()
+    _wait_until(app, lambda: window.executor is None)
+
+    # Nothing reaches the widget while hidden
+    assert "hello from the sandbox" not in window.output_text.toPlainText()
+
+    window.toggle_terminal()  # Show again; the flush timer replays the backlog
+    _wait_until(app, lambda: "Command completed" in window.output_text.toPlainText())
+
+    text = window.output_text.toPlainText()
+    header = text.find("Executing: ")
+    assert header != -1
+    command_line = shlex.join([window.sandbox_path, sys.executable, "-c", script])
+    assert text.find(command_line) > header
+    assert header < text.find("hello from the sandbox") < text.find("Command completed")
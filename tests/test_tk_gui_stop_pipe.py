@@ -0,0 +1,75 @@
+"""
+Stop handshake between the Tk GUI and its reader thread, driven with a real
+os.pipe() and real processes. No Tk window is created.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+import types
+
+import pytest
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="the stop pipe is POSIX only")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("tkinter")
+
+from Zencube_gui import ZenCubeGUI
+
+
+@pytest.fixture
+def gui():
+    """Just the state _read_chunks, _drain_stop_pipe and stop_execution use"""
+    stop_r, stop_w = os.pipe()
+    os.set_blocking(stop_r, False)
+    state = types.SimpleNamespace(
+        process=None,
+        _stop_r=stop_r,
+        _stop_w=stop_w,
+        log_output=lambda *args: None,
+        _set_status=lambda *args: None,
+    )
+    yield state
+    os.close(stop_r)
+    os.close(stop_w)
+
+
+def _spawn(script):
+    return subprocess.Popen(
+        ["sh", "-c", script], stdout=subprocess.PIPE, bufsize=0, start_new_session=True
+    )
+
+
+def test_stop_returns_while_a_child_still_holds_the_pipe(gui):
+    # The background sleep inherits stdout and keeps the pipe open after the shell is terminated
+    gui.process = _spawn("echo started; sleep 30 & wait")
+    try:
+        chunks = ZenCubeGUI._read_chunks(gui, gui.process.stdout.fileno())
+        assert next(chunks) == b"started\n"
+
+        started = time.monotonic()
+        ZenCubeGUI.stop_execution(gui)
+        assert list(chunks) == []
+        assert time.monotonic() - started < 5
+    finally:
+        os.killpg(gui.process.pid, signal.SIGKILL)
+        gui.process.wait()
+        gui.process.stdout.close()
+
+
+def test_stale_stop_byte_does_not_cancel_the_next_run(gui):
+    # A Stop clicked just as the previous run ended leaves its byte in the pipe
+    os.write(gui._stop_w, b"\0")
+    ZenCubeGUI._drain_stop_pipe(gui)
+
+    process = _spawn("sleep 0.2; echo one; sleep 0.2; echo two")
+    try:
+        output = b"".join(ZenCubeGUI._read_chunks(gui, process.stdout.fileno()))
+    finally:
+        process.wait()
+        process.stdout.close()
+    assert output == b"one\ntwo\n"
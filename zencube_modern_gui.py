@@ -4,47 +4,365 @@ Date: October 13, 2025
 Description: Modern, responsive GUI with React-inspired design using PySide6
 """
 
+import codecs
+import io
 import os
 import subprocess
-import threading
 import platform
+import re
+import selectors
 import shlex
+import signal
+import stat
 import sys
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QTextEdit, QCheckBox, QSlider,
-    QFileDialog, QFrame, QScrollArea, QSpinBox, QComboBox, QMessageBox,
-    QGraphicsDropShadowEffect, QGroupBox, QGridLayout, QSplitter, QSizePolicy,
-    QLayout
-)
-from PySide6.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve, QSize, Signal, QThread,
-    QObject, Property, QRect, QPoint
-)
-from PySide6.QtGui import (
-    QFont, QColor, QPalette, QIcon, QLinearGradient, QPainter, QBrush,
-    QPen, QPixmap, QTextCursor
+    QPushButton, QLabel, QLineEdit, QPlainTextEdit, QCheckBox,
+    QFileDialog, QFrame, QScrollArea, QSpinBox, QMessageBox,
+    QGraphicsDropShadowEffect, QGridLayout, QSplitter, QLayout
 )
+from PySide6.QtCore import Qt, QTimer, QSize, Signal, QThread, QRect, QPoint
+from PySide6.QtGui import QFont, QColor, QTextCursor, QTextCharFormat
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.append(str(PROJECT_ROOT))
+# Kept as a str for sys.path, PYTHONPATH and cwd; prepended so the gui package is found first
+PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from gui.file_jail_panel import attach_file_jail_panel
 from gui.monitor_panel import attach_monitor_panel
 from gui.network_panel import attach_network_panel
 
+_OS_NAME = platform.system()
+_IS_WINDOWS = _OS_NAME == "Windows"
+_LAUNCH_DIR = os.getcwd()  # Nothing in the GUI changes directory, so read it once
+
+_SEPARATOR = "=" * 80
+_TERMINAL_BANNER = "🧊 ZenCube Sandbox Terminal\n" + _SEPARATOR + "\n"
+_EXECUTING_HEADER = "\n" + _SEPARATOR + "\n🚀 Executing: {command}\n" + _SEPARATOR + "\n"
+_SOURCE_EXTS = ('.c', '.cpp', '.cc', '.cxx')  # Source files users pick by mistake
+
+_HELP_HTML = """
+<h2>ZenCube Sandbox - Help</h2>
+
+<h3>Usage:</h3>
+<ol>
+    <li>Select a command using Browse or Quick Commands</li>
+    <li>Add optional arguments</li>
+    <li>Enable resource limits as needed</li>
+    <li>Click Execute Command</li>
+</ol>
+
+<h3>Presets:</h3>
+<ul>
+    <li><b>No Limits:</b> Run without restrictions</li>
+    <li><b>Light:</b> Generous limits for development</li>
+    <li><b>Medium:</b> Balanced limits for testing</li>
+    <li><b>Strict:</b> Tight limits for untrusted code</li>
+</ul>
+
+<h3>WSL Option:</h3>
+<p>Windows users should keep WSL enabled. Linux users should disable it.</p>
+"""
+
+# Everything in the Settings text after the sandbox path, which is the only part that can change
+_SETTINGS_DETAILS = f"""
+        Working Directory: {_LAUNCH_DIR}
+        Platform: {_OS_NAME}
+        
+        Use the settings button to configure custom paths.
+        """
+
+
+@lru_cache(maxsize=128)
+def _split_args(args):
+    """Split an argument string once; the command is rebuilt from the same text many times"""
+    return tuple(shlex.split(args))
+
+
+_BACKSLASH_TO_SLASH = str.maketrans('\\', '/')
+_WIN_DRIVE_RE = re.compile(r"([A-Za-z]):([\\/].*)?\Z", re.DOTALL)  # C:, C:\... or C:/...
+
+
+@lru_cache(maxsize=128)
+def _to_wsl_path(command):
+    """Map a Windows drive path onto its /mnt/<drive> location inside WSL"""
+    match = _WIN_DRIVE_RE.match(command)
+    if not match:
+        return command
+    letter, rest = match.groups()
+    return "/mnt/" + letter.lower() + (rest or "").translate(_BACKSLASH_TO_SLASH)
+
+
+# Application-wide stylesheet; the Modern* widgets select their rules by objectName
+_APP_QSS = """
+    QMainWindow {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #f7fafc, stop:1 #edf2f7);
+    }
+    QWidget {
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 
+            'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', sans-serif;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #e2e8f0;
+        width: 10px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:vertical {
+        background: #cbd5e0;
+        border-radius: 5px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: #a0aec0;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+
+    QPushButton#ModernButtonPrimary {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #667eea, stop:1 #764ba2);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 10px 20px;
+    }
+    QPushButton#ModernButtonPrimary:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #764ba2, stop:1 #667eea);
+    }
+    QPushButton#ModernButtonPrimary:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #5a3a7f, stop:1 #4a5fc1);
+    }
+    QPushButton#ModernButtonPrimary:disabled {
+        background: #cccccc;
+        color: #666666;
+    }
+
+    QPushButton#ModernButton {
+        background: #f0f4f8;
+        color: #2d3748;
+        border: 2px solid #e2e8f0;
+        border-radius: 8px;
+        font-size: 13px;
+        font-weight: 600;
+        padding: 10px 20px;
+    }
+    QPushButton#ModernButton:hover {
+        background: #e2e8f0;
+        border-color: #cbd5e0;
+    }
+    QPushButton#ModernButton:pressed {
+        background: #cbd5e0;
+    }
+
+    /* Frames inside a card (labels included) keep the card look, as before */
+    QFrame#ModernCard, QFrame#ModernCard QFrame {
+        background-color: white;
+        border-radius: 12px;
+        border: 1px solid #e2e8f0;
+    }
+    QFrame#ModernCard QLabel#ModernCardTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #2d3748;
+        background: transparent;
+        border: none;
+    }
+
+    QLineEdit#ModernInput {
+        background-color: #f7fafc;
+        border: 2px solid #e2e8f0;
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 14px;
+        color: #2d3748;
+    }
+    QLineEdit#ModernInput:focus {
+        border-color: #667eea;
+        background-color: white;
+    }
+    QLineEdit#ModernInput:hover {
+        border-color: #cbd5e0;
+    }
+
+    QCheckBox#ModernCheckbox {
+        font-size: 14px;
+        color: #2d3748;
+        spacing: 10px;
+    }
+    QCheckBox#ModernCheckbox::indicator {
+        width: 24px;
+        height: 24px;
+        border-radius: 6px;
+        border: 2px solid #cbd5e0;
+        background: white;
+    }
+    QCheckBox#ModernCheckbox::indicator:hover {
+        border-color: #667eea;
+    }
+    QCheckBox#ModernCheckbox::indicator:checked {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #667eea, stop:1 #764ba2);
+        border-color: #667eea;
+    }
+
+    QSpinBox#ModernSpinBox {
+        background-color: #f7fafc;
+        border: 2px solid #e2e8f0;
+        border-radius: 8px;
+        padding: 8px 15px;
+        font-size: 14px;
+        color: #2d3748;
+    }
+    QSpinBox#ModernSpinBox:focus {
+        border-color: #667eea;
+        background-color: white;
+    }
+    QSpinBox#ModernSpinBox::up-button, QSpinBox#ModernSpinBox::down-button {
+        width: 30px;
+        border-radius: 4px;
+        background: #e2e8f0;
+    }
+    QSpinBox#ModernSpinBox::up-button:hover, QSpinBox#ModernSpinBox::down-button:hover {
+        background: #cbd5e0;
+    }
+    QSpinBox#ModernSpinBox::up-arrow {
+        width: 12px;
+        height: 12px;
+    }
+    QSpinBox#ModernSpinBox::down-arrow {
+        width: 12px;
+        height: 12px;
+    }
+"""
+
+# Per-widget sheets for the one-off layout pieces, built once at import
+_SPLITTER_QSS = """
+QSplitter::handle {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #cbd5e0, stop:0.5 #667eea, stop:1 #cbd5e0);
+    border-radius: 4px;
+    margin: 2px 0px;
+}
+QSplitter::handle:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #667eea, stop:0.5 #764ba2, stop:1 #667eea);
+}
+"""
+
+_SCROLL_AREA_QSS = """
+QScrollArea {
+    background: transparent;
+    border: none;
+}
+QScrollBar:vertical {
+    border: none;
+    background: #f7fafc;
+    width: 10px;
+    border-radius: 5px;
+}
+QScrollBar::handle:vertical {
+    background: #cbd5e0;
+    border-radius: 5px;
+    min-height: 20px;
+}
+QScrollBar::handle:vertical:hover {
+    background: #a0aec0;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    border: none;
+    background: none;
+}
+"""
+
+_HEADER_TITLE_QSS = """
+QLabel {
+    font-size: 28px;
+    font-weight: bold;
+    color: #1a202c;
+    background: transparent;
+    border: none;
+}
+"""
+
+_HEADER_SUBTITLE_QSS = """
+QLabel {
+    font-size: 14px;
+    color: #718096;
+    background: transparent;
+    border: none;
+}
+"""
+
+_TERMINAL_QSS = """
+QPlainTextEdit {
+    background-color: #1a202c;
+    color: #00ff00;
+    border: none;
+    border-radius: 8px;
+    padding: 15px;
+    font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+    font-size: 13px;
+    line-height: 1.5;
+}
+"""
+
+_STATUS_BAR_QSS = """
+QStatusBar {
+    background: #f7fafc;
+    color: #4a5568;
+    border-top: 1px solid #e2e8f0;
+    padding: 5px;
+}
+"""
+
+
+# Drop shadows render each widget offscreen and blur it on every repaint;
+# set ZENCUBE_REDUCED_EFFECTS=1 to skip them on slow machines or remote displays
+REDUCED_EFFECTS = os.environ.get("ZENCUBE_REDUCED_EFFECTS", "").lower() in ("1", "true", "yes")
+
+# Shared shadow colors; setColor() copies them, so one instance serves every widget
+_SHADOW_COLOR_BUTTON = QColor(0, 0, 0, 40)
+_SHADOW_COLOR_CARD = QColor(0, 0, 0, 30)
+
+
+def _apply_shadow(widget, blur, color, offset):
+    """Give widget a soft drop shadow unless reduced effects are requested"""
+    if REDUCED_EFFECTS:
+        return
+    shadow = QGraphicsDropShadowEffect(widget)
+    shadow.setBlurRadius(blur)
+    shadow.setColor(color)
+    shadow.setOffset(0, offset)
+    widget.setGraphicsEffect(shadow)
+
 
 class FlowLayout(QLayout):
     """Flow layout that wraps widgets responsively"""
     
     def __init__(self, parent=None, margin=0, spacing=-1):
         super().__init__(parent)
+        # Set up state first: the setters below call invalidate(), which clears these
+        self.item_list = []
+        self._hfw_cache = {}  # width -> height, valid until the items change
+        self._uniform_hint = None  # Shared size hint when every item has the same one
+        self._uniform_checked = False
         self.setContentsMargins(margin, margin, margin, margin)
         self.setSpacing(spacing if spacing >= 0 else 10)
-        self.item_list = []
     
     def __del__(self):
         item = self.takeAt(0)
@@ -53,6 +371,8 @@ class FlowLayout(QLayout):
     
     def addItem(self, item):
         self.item_list.append(item)
+        self._hfw_cache.clear()
+        self._uniform_checked = False
     
     def count(self):
         return len(self.item_list)
@@ -64,9 +384,17 @@ class FlowLayout(QLayout):
     
     def takeAt(self, index):
         if 0 <= index < len(self.item_list):
+            self._hfw_cache.clear()
+            self._uniform_checked = False
             return self.item_list.pop(index)
         return None
     
+    def invalidate(self):
+        # Qt calls this whenever a child's size hint or the spacing changes
+        self._hfw_cache.clear()
+        self._uniform_checked = False
+        super().invalidate()
+    
     def expandingDirections(self):
         return Qt.Orientations(0)
     
@@ -74,7 +402,12 @@ class FlowLayout(QLayout):
         return True
     
     def heightForWidth(self, width):
-        return self._do_layout(QRect(0, 0, width, 0), True)
+        height = self._hfw_cache.get(width)
+        if height is None:
+            if len(self._hfw_cache) >= 64:  # Keep a long resize drag from piling up widths
+                self._hfw_cache.clear()
+            height = self._hfw_cache[width] = self._do_layout(QRect(0, 0, width, 0), True)
+        return height
     
     def setGeometry(self, rect):
         super().setGeometry(rect)
@@ -91,29 +424,55 @@ class FlowLayout(QLayout):
         size += QSize(2 * margin, 2 * margin)
         return size
     
+    def _uniform_size(self):
+        """Return the common size hint of all items, or None if they differ"""
+        if not self._uniform_checked:
+            hints = {(hint.width(), hint.height()) for hint in (item.sizeHint() for item in self.item_list)}
+            self._uniform_hint = QSize(*hints.pop()) if len(hints) == 1 else None
+            self._uniform_checked = True
+        return self._uniform_hint
+    
     def _do_layout(self, rect, test_only):
-        x = rect.x()
+        left = rect.x()
+        right = rect.right()
+        x = left
         y = rect.y()
         line_height = 0
         spacing = self.spacing()
         
+        if not self.item_list:
+            return 0
+        
+        hint = self._uniform_size()
+        if hint is not None:
+            # Same-sized items pack into a plain grid, placed by arithmetic
+            step_x = hint.width() + spacing
+            step_y = hint.height() + spacing
+            cols = max(1, (rect.width() - 1 + spacing) // step_x)
+            if not test_only:
+                for index, item in enumerate(self.item_list):
+                    row, col = divmod(index, cols)
+                    item.setGeometry(QRect(QPoint(left + col * step_x, y + row * step_y), hint))
+            rows = -(-len(self.item_list) // cols)
+            return rows * step_y - spacing
+        
         for item in self.item_list:
-            widget = item.widget()
-            space_x = spacing
-            space_y = spacing
+            # sizeHint() can re-resolve style sheets and font metrics; ask once per item
+            hint = item.sizeHint()
+            width = hint.width()
             
-            next_x = x + item.sizeHint().width() + space_x
-            if next_x - space_x > rect.right() and line_height > 0:
-                x = rect.x()
-                y = y + line_height + space_y
-                next_x = x + item.sizeHint().width() + space_x
+            next_x = x + width + spacing
+            if next_x - spacing > right and line_height > 0:
+                x = left
+                y = y + line_height + spacing
+                next_x = x + width + spacing
                 line_height = 0
             
             if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                item.setGeometry(QRect(QPoint(x, y), hint))
             
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            line_height = max(line_height, hint.height())
         
         return y + line_height - rect.y()
 
@@ -129,79 +488,26 @@ class ModernButton(QPushButton):
         self._setup_style()
     
     def _setup_style(self):
-        if self.primary:
-            self.setStyleSheet("""
-                QPushButton {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #667eea, stop:1 #764ba2);
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    font-size: 14px;
-                    font-weight: bold;
-                    padding: 10px 20px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #764ba2, stop:1 #667eea);
-                }
-                QPushButton:pressed {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #5a3a7f, stop:1 #4a5fc1);
-                }
-                QPushButton:disabled {
-                    background: #cccccc;
-                    color: #666666;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background: #f0f4f8;
-                    color: #2d3748;
-                    border: 2px solid #e2e8f0;
-                    border-radius: 8px;
-                    font-size: 13px;
-                    font-weight: 600;
-                    padding: 10px 20px;
-                }
-                QPushButton:hover {
-                    background: #e2e8f0;
-                    border-color: #cbd5e0;
-                }
-                QPushButton:pressed {
-                    background: #cbd5e0;
-                }
-            """)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 40))
-        shadow.setOffset(0, 4)
-        self.setGraphicsEffect(shadow)
+        # Colors come from the QPushButton#ModernButton* rules in _APP_QSS
+        self.setObjectName("ModernButtonPrimary" if self.primary else "ModernButton")
+        
+        _apply_shadow(self, blur=15, color=_SHADOW_COLOR_BUTTON, offset=4)
 
 
 class ModernCard(QFrame):
     """Modern card widget with shadow"""
     
-    def __init__(self, title=None, parent=None):
+    def __init__(self, title=None, parent=None, shadow=True):
         super().__init__(parent)
         self.setFrameShape(QFrame.StyledPanel)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-                border: 1px solid #e2e8f0;
-            }
-        """)
-        
-        # Add shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 5)
-        self.setGraphicsEffect(shadow)
+        self.setObjectName("ModernCard")
+        # Let the QSS background paint the card. Not opaque or static: the rounded
+        # border is drawn relative to the current size and the corners need the parent.
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        
+        # Cards inside the scroll area pass shadow=False: the effect is recomposited on every scroll step
+        if shadow:
+            _apply_shadow(self, blur=20, color=_SHADOW_COLOR_CARD, offset=5)
         
         # Main layout
         self.main_layout = QVBoxLayout(self)
@@ -211,15 +517,7 @@ class ModernCard(QFrame):
         # Add title if provided
         if title:
             title_label = QLabel(title)
-            title_label.setStyleSheet("""
-                QLabel {
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #2d3748;
-                    background: transparent;
-                    border: none;
-                }
-            """)
+            title_label.setObjectName("ModernCardTitle")
             self.main_layout.addWidget(title_label)
 
 
@@ -230,23 +528,7 @@ class ModernInput(QLineEdit):
         super().__init__(parent)
         self.setPlaceholderText(placeholder)
         self.setMinimumHeight(36)
-        self.setStyleSheet("""
-            QLineEdit {
-                background-color: #f7fafc;
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 14px;
-                color: #2d3748;
-            }
-            QLineEdit:focus {
-                border-color: #667eea;
-                background-color: white;
-            }
-            QLineEdit:hover {
-                border-color: #cbd5e0;
-            }
-        """)
+        self.setObjectName("ModernInput")
 
 
 class ModernCheckbox(QCheckBox):
@@ -254,28 +536,7 @@ class ModernCheckbox(QCheckBox):
     
     def __init__(self, text="", parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet("""
-            QCheckBox {
-                font-size: 14px;
-                color: #2d3748;
-                spacing: 10px;
-            }
-            QCheckBox::indicator {
-                width: 24px;
-                height: 24px;
-                border-radius: 6px;
-                border: 2px solid #cbd5e0;
-                background: white;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #667eea;
-            }
-            QCheckBox::indicator:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #667eea, stop:1 #764ba2);
-                border-color: #667eea;
-            }
-        """)
+        self.setObjectName("ModernCheckbox")
 
 
 class ModernSpinBox(QSpinBox):
@@ -284,36 +545,7 @@ class ModernSpinBox(QSpinBox):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(36)
-        self.setStyleSheet("""
-            QSpinBox {
-                background-color: #f7fafc;
-                border: 2px solid #e2e8f0;
-                border-radius: 8px;
-                padding: 8px 15px;
-                font-size: 14px;
-                color: #2d3748;
-            }
-            QSpinBox:focus {
-                border-color: #667eea;
-                background-color: white;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                width: 30px;
-                border-radius: 4px;
-                background: #e2e8f0;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background: #cbd5e0;
-            }
-            QSpinBox::up-arrow {
-                width: 12px;
-                height: 12px;
-            }
-            QSpinBox::down-arrow {
-                width: 12px;
-                height: 12px;
-            }
-        """)
+        self.setObjectName("ModernSpinBox")
 
 
 class CommandExecutor(QThread):
@@ -322,31 +554,86 @@ class CommandExecutor(QThread):
     finished_signal = Signal(int)
     started_signal = Signal(int)
     
+    # Output is forwarded to the GUI once a batch holds this many characters or is this many seconds old
+    BATCH_CHARS = 4096
+    BATCH_INTERVAL = 0.016
+    # Seconds the process group gets to exit after a stop request before it is killed
+    STOP_GRACE = 2.0
+    
     def __init__(self, command_parts, env=None, cwd=None):
         super().__init__()
         self.command_parts = command_parts
         self.process = None
+        self.pgid = None  # POSIX only; recorded at launch so stop() never signals a reused id
         self.env = env
         self.cwd = cwd
     
     def run(self):
         try:
+            # Start the command in its own process group so stop() reaches everything it spawns
+            if _IS_WINDOWS:
+                group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+            else:
+                group_kwargs = {"start_new_session": True}
             self.process = subprocess.Popen(
                 self.command_parts,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+                bufsize=0,
                 env=self.env,
                 cwd=self.cwd,
+                **group_kwargs,
             )
+            if not _IS_WINDOWS:
+                self.pgid = self.process.pid  # start_new_session makes the child its group leader
             if self.process.pid:
                 self.started_signal.emit(self.process.pid)
             
-            for line in iter(self.process.stdout.readline, ''):
-                if line:
-                    self.output_received.emit(line)
+            # Read raw 64 KiB chunks; the decoder copes with characters split across reads
+            fd = self.process.stdout.fileno()
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")("replace"), translate=True
+            )
+            # While a batch is held, wait for more output only until its deadline, so partial
+            # lines such as \r progress bars still show up. Selectors can't watch pipes on
+            # Windows, so there every read is sent straight away.
+            selector = None
+            if not _IS_WINDOWS:
+                selector = selectors.DefaultSelector()
+                selector.register(fd, selectors.EVENT_READ)
+            batch = []
+            batch_size = 0
+            deadline = 0.0
+            try:
+                while True:
+                    if (selector is not None and batch
+                            and not selector.select(max(0.0, deadline - time.monotonic()))):
+                        self.output_received.emit("".join(batch))
+                        batch.clear()
+                        batch_size = 0
+                        continue
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    text = decoder.decode(chunk)
+                    if not text:
+                        continue
+                    if not batch:
+                        deadline = time.monotonic() + self.BATCH_INTERVAL
+                    batch.append(text)
+                    batch_size += len(text)
+                    if (selector is None
+                            or batch_size >= self.BATCH_CHARS
+                            or time.monotonic() >= deadline):
+                        self.output_received.emit("".join(batch))
+                        batch.clear()
+                        batch_size = 0
+            finally:
+                if selector is not None:
+                    selector.close()
+            batch.append(decoder.decode(b"", final=True))
+            if any(batch):
+                self.output_received.emit("".join(batch))
             
             self.process.wait()
             self.finished_signal.emit(self.process.returncode)
@@ -355,15 +642,41 @@ class CommandExecutor(QThread):
             self.output_received.emit(f"❌ Error: {str(e)}\n")
             self.finished_signal.emit(-1)
     
+    def _signal_group(self, sig):
+        """Send sig to the command's process group; return False once the group is gone"""
+        try:
+            os.killpg(self.pgid, sig)
+        except ProcessLookupError:
+            return False
+        return True
+    
+    def _stop_group(self):
+        """SIGTERM the whole group, then SIGKILL it if any member outlives the grace period"""
+        self._signal_group(signal.SIGTERM)
+        deadline = time.monotonic() + self.STOP_GRACE
+        while True:
+            # Reap the leader as soon as it exits; a zombie would still count as a member
+            self.process.poll()
+            if not self._signal_group(0):
+                break
+            if time.monotonic() >= deadline:
+                self._signal_group(signal.SIGKILL)
+                break
+            time.sleep(0.05)
+        self.process.wait()
+    
     def stop(self):
-        """Stop the running process forcefully"""
+        """Stop the running process and everything it spawned"""
         if self.process:
             try:
+                if self.pgid is not None:
+                    self._stop_group()
+                    return
                 # Try graceful termination first
-                self.process.terminate()
+                self.process.send_signal(signal.CTRL_BREAK_EVENT)
                 # Wait a short time for graceful shutdown
                 try:
-                    self.process.wait(timeout=2)
+                    self.process.wait(timeout=self.STOP_GRACE)
                 except subprocess.TimeoutExpired:
                     # Force kill if it doesn't terminate
                     self.process.kill()
@@ -376,30 +689,79 @@ class CommandExecutor(QThread):
                     pass
 
 
+class SandboxValidator(QThread):
+    """Thread that checks the sandbox binary without blocking the GUI"""
+    message = Signal(str, str)
+    
+    def __init__(self, sandbox_path):
+        super().__init__()
+        self.sandbox_path = sandbox_path
+    
+    def run(self):
+        # The path may sit on a slow network or WSL mount, so keep these calls off the GUI thread
+        if not os.path.exists(self.sandbox_path):
+            self.message.emit("⚠️ WARNING: Sandbox binary not found!\n", "warning")
+            self.message.emit(f"Looking for: {self.sandbox_path}\n", "warning")
+            self.message.emit(f"Current directory: {_LAUNCH_DIR}\n\n", "info")
+        elif not _IS_WINDOWS and not os.access(self.sandbox_path, os.X_OK):
+            self.message.emit("⚠️ Sandbox found but not executable!\n", "warning")
+            self.message.emit(f"Run: chmod +x {self.sandbox_path}\n\n", "info")
+        else:
+            self.message.emit(f"✅ Sandbox found: {self.sandbox_path}\n\n", "success")
+
+
 class ZenCubeModernGUI(QMainWindow):
     """Modern ZenCube GUI with PySide6"""
     
+    QUICK_COMMANDS = (
+        ("📋 ls", "/bin/ls", "-la"),
+        ("💬 echo", "/bin/echo", "Hello ZenCube!"),
+        ("👤 whoami", "/usr/bin/whoami", ""),
+        ("⏱️ CPU Test", "./tests/infinite_loop", ""),
+        ("💾 Memory Test", "./tests/memory_hog", ""),
+    )
+    
+    MAX_OUTPUT_BLOCKS = 5000  # Oldest terminal lines are discarded past this
+    HIDDEN_BACKLOG = 500  # Messages kept while the terminal is hidden, shown again when it returns
+    
+    OUTPUT_COLORS = {
+        "error": "#ff4444",
+        "success": "#44ff44",
+        "warning": "#ffaa00",
+        "info": "#4a9eff",
+        None: "#00ff00",  # Command output
+    }
+    
     def __init__(self):
         super().__init__()
         self.executor = None
-        self.use_wsl = platform.system() == "Windows"
+        self.use_wsl = _IS_WINDOWS
         self.sandbox_path = self.detect_sandbox_path()
+        self._update_mode_state()
         self.terminal_visible = True  # Track terminal visibility
+        self.file_jail_panel = None  # The three panels are attached by _attach_deferred_panels
         self.network_panel = None
         self.monitor_panel = None
         self._last_raw_command: list[str] = []
         self._last_prepared_command: list[str] = []
+        self._base_env = self._prepare_base_env()  # Copied per run; only the panels' overrides vary
+        self._message_box = None  # Dialogs are built on first use and reused afterwards
+        self._settings_box = None
+        self._help_box = None
         
         self.setWindowTitle("ZenCube Sandbox - Modern UI")
         self.setMinimumSize(1000, 700)
         self.resize(1200, 750)
         
-        # Setup UI
-        self.setup_ui()
+        # Setup UI (theme first so widgets are polished once, not again afterwards)
         self.apply_theme()
+        self.setup_ui()
         
         # Center window
         self.center_window()
+        
+        # Let the window appear before the optional panels are built
+        QTimer.singleShot(0, self._attach_deferred_panels)
     
     def detect_sandbox_path(self):
         """Detect sandbox binary path - returns absolute path"""
@@ -415,12 +777,13 @@ class ZenCubeModernGUI(QMainWindow):
         
         for path in possible_paths:
             full_path = os.path.abspath(path)
-            if os.path.exists(full_path) and os.path.isfile(full_path):
-                if platform.system() != "Windows":
-                    if os.access(full_path, os.X_OK):
-                        return full_path  # Return absolute path
-                else:
-                    return full_path  # Return absolute path
+            try:
+                mode = os.stat(full_path).st_mode
+            except OSError:
+                continue
+            
+            if stat.S_ISREG(mode) and (_IS_WINDOWS or os.access(full_path, os.X_OK)):
+                return full_path  # Return absolute path
         
         # Fallback: return absolute path to expected location
         return os.path.join(script_dir, "sandbox")
@@ -451,47 +814,14 @@ class ZenCubeModernGUI(QMainWindow):
         splitter = QSplitter(Qt.Vertical)
         splitter.setHandleWidth(8)
         splitter.setChildrenCollapsible(False)
-        splitter.setStyleSheet("""
-            QSplitter::handle {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #cbd5e0, stop:0.5 #667eea, stop:1 #cbd5e0);
-                border-radius: 4px;
-                margin: 2px 0px;
-            }
-            QSplitter::handle:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #667eea, stop:0.5 #764ba2, stop:1 #667eea);
-            }
-        """)
+        splitter.setOpaqueResize(False)  # Relayout once on release, not on every pixel of the drag
+        splitter.setStyleSheet(_SPLITTER_QSS)
         
         # Top section (command and limits) with scroll area
         top_scroll = QScrollArea()
         top_scroll.setWidgetResizable(True)
         top_scroll.setFrameShape(QFrame.NoFrame)
-        top_scroll.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #f7fafc;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #cbd5e0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #a0aec0;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-        """)
+        top_scroll.setStyleSheet(_SCROLL_AREA_QSS)
         
         top_widget = QWidget()
         top_layout = QVBoxLayout(top_widget)
@@ -539,25 +869,10 @@ class ZenCubeModernGUI(QMainWindow):
         title_layout = QVBoxLayout()
         
         title = QLabel("🧊 ZenCube Sandbox")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 28px;
-                font-weight: bold;
-                color: #1a202c;
-                background: transparent;
-                border: none;
-            }
-        """)
+        title.setStyleSheet(_HEADER_TITLE_QSS)
         
         subtitle = QLabel("Execute commands safely with resource limits")
-        subtitle.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                color: #718096;
-                background: transparent;
-                border: none;
-            }
-        """)
+        subtitle.setStyleSheet(_HEADER_SUBTITLE_QSS)
         
         title_layout.addWidget(title)
         title_layout.addWidget(subtitle)
@@ -577,7 +892,7 @@ class ZenCubeModernGUI(QMainWindow):
     
     def create_command_section(self, layout):
         """Create command selection section"""
-        card = ModernCard("Command Selection")
+        card = ModernCard("Command Selection", shadow=False)
         
         # Command path
         cmd_layout = QHBoxLayout()
@@ -618,17 +933,11 @@ class ZenCubeModernGUI(QMainWindow):
         # Use FlowLayout for responsive wrapping
         quick_layout = FlowLayout(spacing=10)
         
-        quick_commands = [
-            ("📋 ls", "/bin/ls", "-la"),
-            ("💬 echo", "/bin/echo", "Hello ZenCube!"),
-            ("👤 whoami", "/usr/bin/whoami", ""),
-            ("⏱️ CPU Test", "./tests/infinite_loop", ""),
-            ("💾 Memory Test", "./tests/memory_hog", ""),
-        ]
-        
-        for label, cmd, args in quick_commands:
+        for label, cmd, args in self.QUICK_COMMANDS:
             btn = ModernButton(label)
-            btn.clicked.connect(lambda checked, c=cmd, a=args: self.set_quick_command(c, a))
+            btn.setProperty("command", cmd)
+            btn.setProperty("args", args)
+            btn.clicked.connect(self._on_quick_command_clicked)
             quick_layout.addWidget(btn)
         
         card.main_layout.addLayout(quick_layout)
@@ -637,7 +946,7 @@ class ZenCubeModernGUI(QMainWindow):
     
     def create_limits_section(self, layout):
         """Create resource limits section"""
-        card = ModernCard("Resource Limits")
+        card = ModernCard("Resource Limits", shadow=False)
         
         # Create grid layout for limits (more compact)
         grid = QGridLayout()
@@ -690,6 +999,14 @@ class ZenCubeModernGUI(QMainWindow):
         
         card.main_layout.addLayout(grid)
         
+        # (checkbox, spinbox, flag format) for each limit, in sandbox argument order
+        self._limit_specs = (
+            (self.cpu_check, self.cpu_spin, "--cpu=%d"),
+            (self.mem_check, self.mem_spin, "--mem=%d"),
+            (self.procs_check, self.procs_spin, "--procs=%d"),
+            (self.fsize_check, self.fsize_spin, "--fsize=%d"),
+        )
+        
         # Presets (more compact)
         preset_label = QLabel("Presets:")
         preset_label.setStyleSheet("font-weight: 600; color: #4a5568; margin-top: 5px;")
@@ -717,7 +1034,7 @@ class ZenCubeModernGUI(QMainWindow):
         self.wsl_check.setChecked(self.use_wsl)
         self.wsl_check.toggled.connect(self.update_wsl_status)
         
-        wsl_info = QLabel(f"Auto-detected: {platform.system()}")
+        wsl_info = QLabel(f"Auto-detected: {_OS_NAME}")
         wsl_info.setStyleSheet("color: #718096; font-size: 12px; margin-left: 34px;")
         
         card.main_layout.addWidget(self.wsl_check)
@@ -727,48 +1044,54 @@ class ZenCubeModernGUI(QMainWindow):
     
     def create_file_jail_section(self, layout):
         """Create the File Jail panel container."""
-        card = ModernCard("File Jail")
-        card.main_layout.setSpacing(12)
-        self.file_jail_panel = attach_file_jail_panel(self, card.main_layout)
-        layout.addWidget(card)
+        self._file_jail_card = ModernCard("File Jail", shadow=False)
+        self._file_jail_card.main_layout.setSpacing(12)
+        layout.addWidget(self._file_jail_card)
 
     def create_network_section(self, layout):
         """Create the network restriction panel container."""
-        card = ModernCard("Network Restrictions")
-        card.main_layout.setSpacing(12)
-        self.network_panel = attach_network_panel(self, card.main_layout)
-        layout.addWidget(card)
+        self._network_card = ModernCard("Network Restrictions", shadow=False)
+        self._network_card.main_layout.setSpacing(12)
+        layout.addWidget(self._network_card)
 
     def create_monitor_section(self, layout):
         """Create the monitoring dashboard panel container."""
-        card = ModernCard("Monitoring & Metrics")
-        card.main_layout.setSpacing(12)
-        self.monitor_panel = attach_monitor_panel(self, card.main_layout)
-        layout.addWidget(card)
+        self._monitor_card = ModernCard("Monitoring & Metrics", shadow=False)
+        self._monitor_card.main_layout.setSpacing(12)
+        layout.addWidget(self._monitor_card)
+
+    def _attach_deferred_panels(self):
+        """Fill the File Jail, network and monitor cards once the event loop is running."""
+        self.file_jail_panel = attach_file_jail_panel(self, self._file_jail_card.main_layout)
+        self.network_panel = attach_network_panel(self, self._network_card.main_layout)
+        self.monitor_panel = attach_monitor_panel(self, self._monitor_card.main_layout)
 
     def create_output_section(self, layout):
         """Create output terminal section"""
         card = ModernCard("Terminal Output")
         
-        self.output_text = QTextEdit()
+        # Plain text keeps appends cheap; old lines drop off past MAX_OUTPUT_BLOCKS
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setMinimumHeight(150)
-        self.output_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #1a202c;
-                color: #00ff00;
-                border: none;
-                border-radius: 8px;
-                padding: 15px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 13px;
-                line-height: 1.5;
-            }
-        """)
+        self.output_text.setMaximumBlockCount(self.MAX_OUTPUT_BLOCKS)
+        self._output_formats = {}
+        for msg_type, color in self.OUTPUT_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._output_formats[msg_type] = fmt
+        self.output_text.setStyleSheet(_TERMINAL_QSS)
+        
+        # Messages logged within one frame are inserted together by _flush_output
+        self._pending_output = []
+        self._hidden_backlog = deque(maxlen=self.HIDDEN_BACKLOG)
+        self._output_flush_timer = QTimer(self)
+        self._output_flush_timer.setSingleShot(True)
+        self._output_flush_timer.setInterval(16)
+        self._output_flush_timer.timeout.connect(self._flush_output)
         
         # Initial message
-        self.log_output("🧊 ZenCube Sandbox Terminal\n", "info")
-        self.log_output("=" * 80 + "\n", "info")
+        self.log_output(_TERMINAL_BANNER, "info")
         self.log_output("Ready to execute commands.\n\n", "success")
         self.validate_sandbox()
         
@@ -817,64 +1140,19 @@ class ZenCubeModernGUI(QMainWindow):
     def create_status_bar(self):
         """Create status bar"""
         status = self.statusBar()
-        status.setStyleSheet("""
-            QStatusBar {
-                background: #f7fafc;
-                color: #4a5568;
-                border-top: 1px solid #e2e8f0;
-                padding: 5px;
-            }
-        """)
-        
-        os_name = platform.system()
-        mode = "WSL Mode" if self.use_wsl else "Native Mode"
-        status.showMessage(f"Ready | OS: {os_name} | {mode} | Sandbox: {self.sandbox_path}")
+        status.setStyleSheet(_STATUS_BAR_QSS)
+        status.showMessage(self._ready_status)
     
     def apply_theme(self):
         """Apply modern theme to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #f7fafc, stop:1 #edf2f7);
-            }
-            QWidget {
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 
-                    'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', sans-serif;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #e2e8f0;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background: #cbd5e0;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #a0aec0;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        # One app-wide sheet is parsed once; the Modern* widgets only carry object names
+        QApplication.instance().setStyleSheet(_APP_QSS)
     
     def validate_sandbox(self):
-        """Validate sandbox exists"""
-        if not os.path.exists(self.sandbox_path):
-            self.log_output("⚠️ WARNING: Sandbox binary not found!\n", "warning")
-            self.log_output(f"Looking for: {self.sandbox_path}\n", "warning")
-            self.log_output(f"Current directory: {os.getcwd()}\n\n", "info")
-        else:
-            if platform.system() != "Windows":
-                if not os.access(self.sandbox_path, os.X_OK):
-                    self.log_output("⚠️ Sandbox found but not executable!\n", "warning")
-                    self.log_output(f"Run: chmod +x {self.sandbox_path}\n\n", "info")
-                else:
-                    self.log_output(f"✅ Sandbox found: {self.sandbox_path}\n\n", "success")
-            else:
-                self.log_output(f"✅ Sandbox found: {self.sandbox_path}\n\n", "success")
+        """Validate sandbox exists; the result is logged when the background check finishes"""
+        self._sandbox_validator = SandboxValidator(self.sandbox_path)
+        self._sandbox_validator.message.connect(self.log_output)
+        self._sandbox_validator.start()
     
     def browse_file(self):
         """Browse for file"""
@@ -886,13 +1164,18 @@ class ZenCubeModernGUI(QMainWindow):
         )
         
         if file_path:
-            if file_path.endswith('.c') or file_path.endswith('.cpp'):
+            if file_path.endswith(_SOURCE_EXTS):
                 self.log_output(f"⚠️ Warning: Source file selected: {file_path}\n", "warning")
                 self.log_output(f"💡 Select the executable without .c extension\n", "info")
             
             self.command_input.setText(file_path)
             self.log_output(f"📁 Selected: {file_path}\n", "info")
     
+    def _on_quick_command_clicked(self):
+        """Apply the quick command stored on the clicked button"""
+        btn = self.sender()
+        self.set_quick_command(btn.property("command"), btn.property("args"))
+    
     def set_quick_command(self, command, args):
         """Set quick command"""
         self.command_input.setText(command)
@@ -943,19 +1226,20 @@ class ZenCubeModernGUI(QMainWindow):
     def update_wsl_status(self, checked):
         """Update WSL status"""
         self.use_wsl = checked
-        mode = "WSL Mode" if checked else "Native Mode"
-        self.log_output(f"🔄 {mode} enabled\n", "info")
+        self._update_mode_state()
+        self.log_output(f"🔄 {self._mode_label} enabled\n", "info")
         
-        os_name = platform.system()
-        self.statusBar().showMessage(f"Ready | OS: {os_name} | {mode} | Sandbox: {self.sandbox_path}")
+        self.statusBar().showMessage(self._ready_status)
+    
+    def _update_mode_state(self):
+        """Recompute the launcher parts and ready status, which both follow use_wsl and sandbox_path"""
+        self._cmd_prefix = ("wsl", self.sandbox_path) if self.use_wsl else (self.sandbox_path,)
+        self._mode_label = "WSL Mode" if self.use_wsl else "Native Mode"
+        self._ready_status = f"Ready | OS: {_OS_NAME} | {self._mode_label} | Sandbox: {self.sandbox_path}"
     
     def _convert_command_for_platform(self, command: str) -> str:
         if self.use_wsl and ':' in command:
-            path = command.replace('\\', '/')
-            if len(path) > 1 and path[1] == ':':
-                drive = path[0].lower()
-                rest = path[2:]
-                return f"/mnt/{drive}{rest}"
+            return _to_wsl_path(command)
         return command
 
     def _collect_target_command_parts(self) -> list[str]:
@@ -967,7 +1251,7 @@ class ZenCubeModernGUI(QMainWindow):
         parts: list[str] = [command]
         if args_text:
             try:
-                parts.extend(shlex.split(args_text))
+                parts.extend(_split_args(args_text))
             except ValueError as exc:
                 raise ValueError(f"Invalid arguments: {exc}") from exc
         return parts
@@ -986,9 +1270,9 @@ class ZenCubeModernGUI(QMainWindow):
         _, prepared = self.compute_target_commands()
         return list(prepared)
 
-    def _build_execution_env(self) -> dict[str, str]:
+    def _prepare_base_env(self) -> dict[str, str]:
         env = os.environ.copy()
-        root = str(PROJECT_ROOT)
+        root = PROJECT_ROOT
         existing = env.get("PYTHONPATH", "")
         if existing:
             paths = existing.split(os.pathsep)
@@ -996,6 +1280,10 @@ class ZenCubeModernGUI(QMainWindow):
                 env["PYTHONPATH"] = os.pathsep.join([root, existing])
         else:
             env["PYTHONPATH"] = root
+        return env
+
+    def _build_execution_env(self) -> dict[str, str]:
+        env = self._base_env.copy()
         if self.network_panel:
             self.network_panel.apply_env_overrides(env)
         return env
@@ -1004,33 +1292,17 @@ class ZenCubeModernGUI(QMainWindow):
         """Build command with limits"""
         raw_parts, prepared_parts = self.compute_target_commands()
 
-        # Build command
-        if self.use_wsl:
-            cmd_parts = ["wsl", self.sandbox_path]
-        else:
-            cmd_parts = [self.sandbox_path]
+        # Build command; sandbox options start right after the launcher part(s)
+        cmd_parts = list(self._cmd_prefix)
+        options_start = len(cmd_parts)
         
         # Add limits
-        if self.cpu_check.isChecked():
-            cmd_parts.append(f"--cpu={self.cpu_spin.value()}")
-        
-        if self.mem_check.isChecked():
-            cmd_parts.append(f"--mem={self.mem_spin.value()}")
-        
-        if self.procs_check.isChecked():
-            cmd_parts.append(f"--procs={self.procs_spin.value()}")
-        
-        if self.fsize_check.isChecked():
-            cmd_parts.append(f"--fsize={self.fsize_spin.value()}")
+        cmd_parts.extend(fmt % spin.value() for check, spin, fmt in self._limit_specs if check.isChecked())
 
         if self.network_panel and self.network_panel.is_disabled():
             cmd_parts.append("--no-net")
             if self.network_panel.is_enforce_mode():
-                if self.use_wsl:
-                    sandbox_options = cmd_parts[2:].copy()
-                else:
-                    sandbox_options = cmd_parts[1:].copy()
-                enforce_args = sandbox_options + raw_parts
+                enforce_args = [*cmd_parts[options_start:], *raw_parts]
                 self.network_panel.show_enforce_command(self.sandbox_path, enforce_args)
             else:
                 self.network_panel.reset_note()
@@ -1045,8 +1317,8 @@ class ZenCubeModernGUI(QMainWindow):
         try:
             # Check if already running
             if self.executor and self.executor.isRunning():
-                QMessageBox.warning(
-                    self, 
+                self._show_message(
+                    QMessageBox.Warning,
                     "Already Running", 
                     "A command is already executing. Please stop it first."
                 )
@@ -1055,12 +1327,12 @@ class ZenCubeModernGUI(QMainWindow):
             # Validate
             command = self.command_input.text().strip()
             if not command:
-                QMessageBox.warning(self, "Error", "Please enter a command")
+                self._show_message(QMessageBox.Warning, "Error", "Please enter a command")
                 return
             
-            if command.endswith('.c') or command.endswith('.cpp'):
-                QMessageBox.critical(
-                    self,
+            if command.endswith(_SOURCE_EXTS):
+                self._show_message(
+                    QMessageBox.Critical,
                     "Invalid File",
                     f"Cannot execute source file!\n\n{command}\n\nSelect the compiled executable."
                 )
@@ -1071,9 +1343,7 @@ class ZenCubeModernGUI(QMainWindow):
             env = self._build_execution_env()
             
             # Log
-            self.log_output("\n" + "=" * 80 + "\n", "info")
-            self.log_output(f"🚀 Executing: {' '.join(cmd_parts)}\n", "info")
-            self.log_output("=" * 80 + "\n", "info")
+            self.log_output(lambda: _EXECUTING_HEADER.format(command=shlex.join(cmd_parts)), "info")
             
             # Update UI
             self.execute_btn.setEnabled(False)
@@ -1081,14 +1351,14 @@ class ZenCubeModernGUI(QMainWindow):
             self.statusBar().showMessage("Running...")
             
             # Execute in thread
-            self.executor = CommandExecutor(cmd_parts, env=env, cwd=str(PROJECT_ROOT))
+            self.executor = CommandExecutor(cmd_parts, env=env, cwd=PROJECT_ROOT)
             self.executor.output_received.connect(self.log_output)
             self.executor.started_signal.connect(self._on_process_started)
             self.executor.finished_signal.connect(self.on_command_finished)
             self.executor.start()
             
         except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+            self._show_message(QMessageBox.Critical, "Error", str(e))
             self.log_output(f"❌ Error: {e}\n", "error")
             # Reset UI on error
             self.execute_btn.setEnabled(True)
@@ -1134,9 +1404,7 @@ class ZenCubeModernGUI(QMainWindow):
                 self.network_panel.handle_execution_finished()
             
             # Update status bar
-            os_name = platform.system()
-            mode = "WSL Mode" if self.use_wsl else "Native Mode"
-            self.statusBar().showMessage(f"Ready | OS: {os_name} | {mode} | Sandbox: {self.sandbox_path}")
+            self.statusBar().showMessage(self._ready_status)
             
             # Clear executor reference
             self.executor = None
@@ -1166,9 +1434,7 @@ class ZenCubeModernGUI(QMainWindow):
         else:
             self.log_output(f"\n⚠️ Command exited with code: {exit_code}\n", "warning")
         
-        os_name = platform.system()
-        mode = "WSL Mode" if self.use_wsl else "Native Mode"
-        self.statusBar().showMessage(f"Ready | OS: {os_name} | {mode} | Sandbox: {self.sandbox_path}")
+        self.statusBar().showMessage(self._ready_status)
         
         # Clear executor reference
         self.executor = None
@@ -1178,6 +1444,14 @@ class ZenCubeModernGUI(QMainWindow):
         self.terminal_visible = not self.terminal_visible
         
         if self.terminal_visible:
+            # Catch up on what was logged while hidden, rendering deferred messages now
+            self._pending_output.extend(
+                (message if isinstance(message, str) else message(), msg_type)
+                for message, msg_type in self._hidden_backlog
+            )
+            self._hidden_backlog.clear()
+            if self._pending_output and not self._output_flush_timer.isActive():
+                self._output_flush_timer.start()
             self.bottom_widget.show()
             self.toggle_terminal_btn.setText("👁️ Hide Terminal")
             # Restore splitter sizes
@@ -1193,27 +1467,42 @@ class ZenCubeModernGUI(QMainWindow):
         self.log_output(f"{'📺 Terminal shown' if self.terminal_visible else '🔇 Terminal hidden'}\n", "info")
     
     def log_output(self, message, msg_type=None):
-        """Log output to terminal"""
-        cursor = self.output_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        
-        # Color based on type
-        if msg_type == "error":
-            color = "#ff4444"
-        elif msg_type == "success":
-            color = "#44ff44"
-        elif msg_type == "warning":
-            color = "#ffaa00"
-        elif msg_type == "info":
-            color = "#4a9eff"
-        else:
-            color = "#00ff00"
+        """Log output to terminal; message may be a callable that is only rendered once it is shown"""
+        if not self.terminal_visible:
+            # Nothing is drawn while hidden; keep the recent messages (callables unrendered)
+            # for toggle_terminal to replay, and surface errors elsewhere
+            self._hidden_backlog.append((message, msg_type))
+            if msg_type == "error":
+                self.statusBar().showMessage((message if isinstance(message, str) else message()).strip())
+            return
+        if not isinstance(message, str):
+            message = message()
+        self._pending_output.append((message, msg_type))
+        if not self._output_flush_timer.isActive():
+            self._output_flush_timer.start()
+    
+    def _flush_output(self):
+        """Insert everything logged since the last flush in one edit"""
+        pending = self._pending_output
+        if not pending:
+            return
+        self._pending_output = []
+        formats = self._output_formats
+        scrollbar = self.output_text.verticalScrollBar()
+        follow = scrollbar.value() >= scrollbar.maximum()
         
-        # Convert newlines to HTML breaks and escape HTML characters
-        html_message = message.replace("<", "&lt;").replace(">", "&gt;").replace("\n", "<br>")
-        cursor.insertHtml(f'<span style="color: {color};">{html_message}</span>')
-        self.output_text.setTextCursor(cursor)
-        self.output_text.ensureCursorVisible()
+        # A document cursor appends without moving the view's cursor or selection
+        cursor = QTextCursor(self.output_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        # Newlines become real blocks here, which is what the block cap counts
+        for msg_type, group in groupby(pending, key=itemgetter(1)):
+            cursor.insertText("".join(message for message, _ in group),
+                              formats.get(msg_type, formats[None]))
+        cursor.endEditBlock()
+        # Only follow the output if the user hasn't scrolled up to read something
+        if follow:
+            scrollbar.setValue(scrollbar.maximum())
 
     def closeEvent(self, event):  # noqa: D401 - Qt event override
         if self.monitor_panel:
@@ -1222,54 +1511,37 @@ class ZenCubeModernGUI(QMainWindow):
     
     def clear_output(self):
         """Clear output"""
+        self._pending_output.clear()
+        self._hidden_backlog.clear()
         self.output_text.clear()
-        self.log_output("🧊 ZenCube Sandbox Terminal\n", "info")
-        self.log_output("=" * 80 + "\n", "info")
+        self.log_output(_TERMINAL_BANNER, "info")
         self.log_output("Output cleared.\n\n", "success")
     
+    def _show_message(self, icon, title, text):
+        """Show a warning or error, reusing one message box for all of them"""
+        if self._message_box is None:
+            self._message_box = QMessageBox(self)
+        self._message_box.setIcon(icon)
+        self._message_box.setWindowTitle(title)
+        self._message_box.setText(text)
+        self._message_box.exec()
+    
     def show_settings(self):
         """Show settings dialog"""
-        dialog = QMessageBox(self)
-        dialog.setWindowTitle("Settings")
-        dialog.setText(f"""
-        Sandbox Path: {self.sandbox_path}
-        Working Directory: {os.getcwd()}
-        Platform: {platform.system()}
-        
-        Use the settings button to configure custom paths.
-        """)
-        dialog.exec()
+        if self._settings_box is None:
+            self._settings_box = QMessageBox(self)
+            self._settings_box.setWindowTitle("Settings")
+        self._settings_box.setText("\n        Sandbox Path: " + self.sandbox_path + _SETTINGS_DETAILS)
+        self._settings_box.exec()
     
     def show_help(self):
         """Show help"""
-        help_text = """
-        <h2>ZenCube Sandbox - Help</h2>
-        
-        <h3>Usage:</h3>
-        <ol>
-            <li>Select a command using Browse or Quick Commands</li>
-            <li>Add optional arguments</li>
-            <li>Enable resource limits as needed</li>
-            <li>Click Execute Command</li>
-        </ol>
-        
-        <h3>Presets:</h3>
-        <ul>
-            <li><b>No Limits:</b> Run without restrictions</li>
-            <li><b>Light:</b> Generous limits for development</li>
-            <li><b>Medium:</b> Balanced limits for testing</li>
-            <li><b>Strict:</b> Tight limits for untrusted code</li>
-        </ul>
-        
-        <h3>WSL Option:</h3>
-        <p>Windows users should keep WSL enabled. Linux users should disable it.</p>
-        """
-        
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Help")
-        msg.setTextFormat(Qt.RichText)
-        msg.setText(help_text)
-        msg.exec()
+        if self._help_box is None:
+            self._help_box = QMessageBox(self)
+            self._help_box.setWindowTitle("Help")
+            self._help_box.setTextFormat(Qt.RichText)
+            self._help_box.setText(_HELP_HTML)
+        self._help_box.exec()
 
 
 def main():